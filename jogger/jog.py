@@ -48,30 +48,34 @@ def main(argv=None):
     stdout = OutputWrapper(sys.stdout)
     stderr = OutputWrapper(sys.stderr, default_style='error')
     
+    task_name = arguments.task_name
+    
     try:
         conf = JogConf()
         tasks = conf.get_tasks()
-        for name, task in tasks.items():
-            tasks[name] = TaskProxy(prog, name, task, conf, argv=arguments.extra)
+        
+        # Only create proxies for the tasks that are actually needed: just
+        # the named task when executing one, or all of them when listing
+        if task_name:
+            if task_name not in tasks:
+                stderr.write(f'Unknown task "{task_name}".')
+                sys.exit(1)
+            
+            proxy = TaskProxy(prog, task_name, tasks[task_name], conf, argv=arguments.extra)
+        else:
+            proxies = [TaskProxy(prog, name, task, conf) for name, task in tasks.items()]
     except (FileNotFoundError, TaskDefinitionError) as e:
         stderr.write(str(e))
         sys.exit(1)
     
-    task_name = arguments.task_name
     if task_name:
-        try:
-            task = tasks[task_name]
-        except KeyError:
-            stderr.write(f'Unknown task "{task_name}".')
-            sys.exit(1)
-        
-        task.execute(passive=False)
-    elif not tasks:
+        proxy.execute(passive=False, final=True)
+    elif not proxies:
         stdout.write('No tasks defined.')
     else:
         stdout.write('Available tasks:', 'label')
-        for task in tasks.values():
-            stdout.write(task.get_description(stdout.styler))
+        for proxy in proxies:
+            stdout.write(proxy.get_description(stdout.styler))
 
 
 if __name__ == '__main__':
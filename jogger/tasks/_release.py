@@ -1,21 +1,14 @@
 import configparser
+import glob
 import os.path
 import re
+import shutil
 import sys
+from importlib.util import find_spec
 
 from .base import Task, TaskError
 
-try:
-    import build  # noqa
-    HAS_BUILD = True
-except ImportError:
-    HAS_BUILD = False
-
-try:
-    import twine  # noqa
-    HAS_TWINE = True
-except ImportError:
-    HAS_TWINE = False
+COMMENT_LINE_RE = re.compile(r'^ *#.*\n?', re.MULTILINE)
 
 
 def strip_comments(text):
@@ -24,8 +17,7 @@ def strip_comments(text):
     whitespace from ``text``.
     """
     
-    # (m?) enables multiline mode
-    return re.sub(r'(?m)^ *#.*\n?', '', text).strip()
+    return COMMENT_LINE_RE.sub('', text).strip()
 
 
 class ReleaseTask(Task):
@@ -109,6 +101,11 @@ class ReleaseTask(Task):
     
     def handle(self, *args, **options):
         
+        # Stop before running anything if the version isn't actually changing
+        # (e.g. when retrying a previously completed release)
+        if self.current_version == self.new_version:
+            raise TaskError(f'Version is already {self.current_version}; nothing to release.')
+        
         current_branch_name = self.verify_state()
         
         labeller = self.styler.label
@@ -137,55 +134,101 @@ class ReleaseTask(Task):
             return
         
         # Ensure the necessary Python libraries to build and release the
-        # package are available
-        if not HAS_BUILD:
+        # package are available. They are only ever run as separate processes,
+        # so locate them without importing them.
+        if not find_spec('build'):
             raise TaskError('Missing requirement: build')
         
-        if not HAS_TWINE:
+        if not find_spec('twine'):
             raise TaskError('Missing requirement: twine')
         
         # Ensure a correct-looking .pypirc is present
+        try:
+            with open(os.path.expanduser('~/.pypirc'), 'r') as f:
+                pypirc_contents = f.read()
+        except FileNotFoundError:
+            raise TaskError('A ~/.pypirc file is missing.')
+        except OSError as e:
+            raise TaskError(f'The ~/.pypirc file could not be read ({e.strerror}).')
+        except UnicodeDecodeError:
+            raise TaskError('The ~/.pypirc file could not be decoded.')
+        
         config_file = configparser.ConfigParser()
-        config_file.read(os.path.expanduser('~/.pypirc'))
+        try:
+            config_file.read_string(pypirc_contents, source='~/.pypirc')
+        except configparser.Error:
+            raise TaskError('The ~/.pypirc file could not be parsed.')
         
         try:
             pypi_config = config_file['pypi']
         except KeyError:
-            raise TaskError('A ~/.pypirc file is missing or does not contain a [pypi] section.')
+            raise TaskError('The ~/.pypirc file does not contain a [pypi] section.')
         
         if 'username' not in pypi_config or 'password' not in pypi_config:
             raise TaskError('The PyPI config file must contain at least a username and password.')
         
         self.stdout.write('PyPI build dependencies present')
     
+    def _count_unpushed(self, branch_name):
+        
+        count_result = self.cli(
+            ['git', 'rev-list', '--count', f'origin/{branch_name}..{branch_name}'],
+            capture=True,
+            text=True
+        )
+        if count_result.returncode:
+            self.stderr.write(count_result.stderr, style='normal')
+            raise TaskError('Could not complete check for unpushed changes')
+        
+        return int(count_result.stdout)
+    
+    def _get_status(self):
+        
+        # Get the current branch and any changes to tracked files in a single
+        # call, rather than separate diff-index and branch calls
+        status_result = self.cli(
+            ['git', 'status', '--porcelain=v2', '--branch', '--untracked-files=no'],
+            capture=True,
+            text=True
+        )
+        if status_result.returncode:
+            self.stderr.write(status_result.stderr, style='normal')
+            raise TaskError('Could not determine repository status')
+        
+        branch_name = None
+        uncommitted = False
+        for line in status_result.stdout.splitlines():
+            if line.startswith('# branch.head '):
+                branch_name = line.split(' ', 2)[2]
+            elif not line.startswith('#'):
+                uncommitted = True  # any non-header line is a changed file
+        
+        return branch_name, uncommitted
+    
     def verify_state(self):
         
         self.stdout.write('Verifying state...', style='label')
         
         self._verify_pypi()
         
-        # Ensure there are no uncommitted changes
-        check_result = self.cli('git diff-index --quiet HEAD --')
-        if check_result.returncode:
+        # Ensure there are no uncommitted changes. This is checked before
+        # updating remotes, which is slower and requires network access.
+        branch_name, uncommitted = self._get_status()
+        if uncommitted:
             raise TaskError('Uncommitted changes detected.')
         
-        # Ensure there are no unpushed changes
-        lookup_result = self.cli('git branch --show-current', capture=True)
-        branch_name = lookup_result.stdout.decode('utf-8').strip()
+        if branch_name == '(detached)':
+            raise TaskError('Not currently on a branch.')
         
         # Get remote refs up to date before checking for unpushed changes.
         # Swallow output so it isn't written to the output stream.
-        update_result = self.cli('git remote update', capture=True)
+        update_result = self.cli(['git', 'remote', 'update'], capture=True, text=True)
         if update_result.returncode:
-            self.stderr.write(update_result.stderr.decode('utf-8'), style='normal')
+            self.stderr.write(update_result.stderr, style='normal')
             raise TaskError('Could not update remotes')
         
-        log_result = self.cli(f'git log --oneline origin/{branch_name}..{branch_name} | wc -l', capture=True)
-        if log_result.returncode:
-            self.stderr.write(log_result.stderr.decode('utf-8'), style='normal')
-            raise TaskError('Could not complete check for unpushed changes')
-        
-        if int(log_result.stdout):
+        # Ensure there are no unpushed changes
+        if self._count_unpushed(branch_name):
             raise TaskError('Unpushed changes detected.')
         
         self.stdout.write('All changes committed/pushed')
@@ -207,7 +250,7 @@ class ReleaseTask(Task):
             return current_branch
         
         self.stdout.write('Creating release branch', style='label')
-        create_result = self.cli(f'git checkout -b {new_branch}')
+        create_result = self.cli(['git', 'checkout', '-b', new_branch])
         if create_result.returncode:
             raise TaskError('Failed to create release branch')
         
@@ -261,30 +304,30 @@ class ReleaseTask(Task):
         
         self.stdout.write('Bumping version', style='label')
         
-        all_paths = []
+        # Read all files and apply all replacements before writing anything,
+        # so that failing to detect the version in one file does not leave
+        # previously processed files already modified
+        updates = {}
         
         for path, replacers in self.get_bump_files():
-            all_paths.append(path)
-            
-            with open(path, 'r+') as f:
+            with open(path, 'r') as f:
                 file_contents = f.read()
-                
-                for replacer_fn in replacers:
-                    try:
-                        file_contents = replacer_fn(file_contents)
-                    except TaskError:
-                        raise TaskError(f'Could not detect version in {path}.')
-                
-                # Replace the file contents with the updates. Only truncate
-                # now, as opposed to opening the file in 'w' mode, due to the
-                # potential for errors encountered above leaving the file empty.
-                f.seek(0)
-                f.truncate()
+            
+            for replacer_fn in replacers:
+                try:
+                    file_contents = replacer_fn(file_contents)
+                except TaskError:
+                    raise TaskError(f'Could not detect version in {path}.')
+            
+            updates[path] = file_contents
+        
+        for path, file_contents in updates.items():
+            with open(path, 'w') as f:
                 f.write(file_contents)
         
-        paths_string = ' '.join(all_paths)
+        all_paths = list(updates)
         
-        self.cli(f'git --no-pager diff {paths_string}')
+        self.cli(['git', '--no-pager', 'diff', *all_paths])
         
         self.stdout.write(
             'Check if the above diff is correct. If you proceed, these files '
@@ -294,10 +337,10 @@ class ReleaseTask(Task):
         
         answer = input('Proceed with committing these changes (Y/n)? ')
         if answer.lower() != 'y':
-            self.cli(f'git restore {paths_string}')
+            self.cli(['git', 'restore', *all_paths])
             sys.exit(0)
         
-        self.cli(f'git add {paths_string}')
+        self.cli(['git', 'add', *all_paths])
     
     def commit_and_tag(self, branch_name):
         
@@ -305,8 +348,12 @@ class ReleaseTask(Task):
         
         self.stdout.write('Committing and tagging version bump', style='label')
         
-        diff_result = self.cli('git diff --compact-summary --staged --line-prefix=#', capture=True)
-        commit_summary = diff_result.stdout.decode('utf-8')
+        diff_result = self.cli(
+            ['git', 'diff', '--compact-summary', '--staged', '--line-prefix=#'],
+            capture=True,
+            text=True
+        )
+        commit_summary = diff_result.stdout
         default_commit_msg = (
             '# Committing version bump. Enter a commit message below:\n'
             f'Bumped version to {new_version}.\n\n'
@@ -315,7 +362,7 @@ class ReleaseTask(Task):
         
         commit_msg = self.long_input(default_commit_msg)
         commit_msg = strip_comments(commit_msg)
-        self.cli(f'git commit -m "{commit_msg}"')
+        self.cli(['git', 'commit', '-m', commit_msg])
         
         default_tag_msg = (
             '# Tagging new version. Enter a tag message below:\n'
@@ -324,9 +371,9 @@ class ReleaseTask(Task):
         
         tag_msg = self.long_input(default_tag_msg)
         tag_msg = strip_comments(tag_msg)
-        self.cli(f'git tag -a {new_version} -m "{tag_msg}"')
+        self.cli(['git', 'tag', '-a', new_version, '-m', tag_msg])
         
-        self.cli(f'git push origin {branch_name} --tags')
+        self.cli(['git', 'push', 'origin', branch_name, '--tags'])
     
     def do_build(self):
         
@@ -346,9 +393,13 @@ class ReleaseTask(Task):
             raise TaskError('Upload failed.')
         
         self.stdout.write('\nCleaning up', style='label')
-        rm_result = self.cli('rm -rf ./build/ ./dist/ ./*egg-info/')
-        if rm_result.returncode:
-            raise TaskError('Cleanup failed.')
+        for path in ('./build/', './dist/', *glob.glob('./*egg-info/')):
+            try:
+                shutil.rmtree(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                raise TaskError('Cleanup failed.')
     
     def show_merge_instructions(self, branch_name):
         
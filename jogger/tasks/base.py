@@ -5,6 +5,7 @@ import signal
 import subprocess
 import sys
 import tempfile
+from functools import cached_property
 
 from jogger.exceptions import TaskDefinitionError, TaskError
 from jogger.utils.output import OutputWrapper, clean_description
@@ -12,6 +13,9 @@ from jogger.utils.output import OutputWrapper, clean_description
 TASK_NAME_RE = re.compile(r'^\w+$')
 DEFAULT_DESCRIPTION = 'No task description provided. Just guess?'
 
+# Signals reset to their default handlers by subprocess (restore_signals=True)
+RESTORED_SIGNALS = ('SIGPIPE', 'SIGXFZ', 'SIGXFSZ')
+
 #
 # The class-based "task" interface is heavily based on Django's management
 # command infrastructure, found in ``django.core.management.base``, though
@@ -33,16 +37,22 @@ class BaseTask:
         self.conf = conf
         self._settings = None
         
-        parser = self.create_parser(prog, default_stdout, default_stderr)
-        
         # If no explicit args are provided, use an empty string. This prevents
         # parse_args() from using `sys.argv` as a default value, which is
         # especially problematic if calling one task from within another (e.g.
         # using Task.get_task_proxy()).
         argv = argv or ''
-        options = parser.parse_args(argv)
         
-        kwargs = vars(options)
+        # Without any arguments to parse, the task may be able to supply its
+        # default options directly, avoiding the cost of building a parser
+        kwargs = None
+        if not argv:
+            kwargs = self.get_default_options(default_stdout, default_stderr)
+        
+        if kwargs is None:
+            parser = self.create_parser(prog, default_stdout, default_stderr)
+            options = parser.parse_args(argv)
+            kwargs = vars(options)
         
         stdout = kwargs['stdout']
         stderr = kwargs['stderr']
@@ -58,7 +68,6 @@ class BaseTask:
         no_color = kwargs['no_color']
         self.stdout = OutputWrapper(stdout, no_color=no_color)
         self.stderr = OutputWrapper(stderr, no_color=no_color, default_style='error')
-        self.styler = self.stdout.styler
         
         self.using_system_out = stdout is sys.stdout
         self.using_system_err = stderr is sys.stderr
@@ -116,6 +125,22 @@ class BaseTask:
         # Do nothing - just a hook for subclasses to add custom arguments
         pass
     
+    def get_default_options(self, default_stdout, default_stderr):
+        """
+        Return the options dictionary the task's parser would produce when
+        given no arguments, or ``None`` if it cannot be known without building
+        the parser (the default).
+        """
+        
+        return None
+    
+    @cached_property
+    def styler(self):
+        
+        # A cached_property rather than a plain property, so tasks can still
+        # assign their own styler
+        return self.stdout.styler
+    
     @property
     def settings(self):
         
@@ -124,21 +149,35 @@ class BaseTask:
         
         return self._settings
     
-    def cli(self, cmd, capture=False):
+    def cli(self, cmd, capture=False, text=False):
         """
         Run a command on the system's command line, in the context of the task's
         :attr:`~Task.stdout` and :attr:`~Task.stderr` output streams. Output
         can be captured rather than displayed using ``capture=True``.
         
-        :param cmd: The command string to execute.
+        The command can be given as a string, which is executed via the
+        system's shell, or as a sequence of program arguments, which is
+        executed directly without the overhead of an intermediate shell.
+        
+        Captured output is provided as bytes, unless ``text=True`` is given,
+        in which case it is decoded as UTF-8 as it is read.
+        
+        :param cmd: The command string, or sequence of arguments, to execute.
         :param capture: ``True`` to capture all output from the command rather
             than writing it to the configured output streams.
+        :param text: ``True`` to provide captured output as strings rather
+            than bytes.
         :return: The command result object.
         """
         
+        shell = isinstance(cmd, str)
+        
         kwargs = {}
         if capture:
             kwargs['capture_output'] = True
+            
+            if text:
+                kwargs['encoding'] = 'utf-8'
         else:
             # Pass redirected output streams if necessary
             if not self.using_system_out:
@@ -148,11 +187,23 @@ class BaseTask:
                 kwargs['stderr'] = self.kwargs['stderr']
         
         try:
-            return subprocess.run(cmd, shell=True, **kwargs)  # noqa: S602
+            return subprocess.run(cmd, shell=shell, **kwargs)  # noqa: S602, S603
         except KeyboardInterrupt:
             # Don't show any errors on a KeyboardInterrupt - it may be expected
             # to end the running process
-            return subprocess.CompletedProcess(args=cmd.split(), returncode=-(signal.SIGINT))
+            args = cmd.split() if shell else list(cmd)
+            return subprocess.CompletedProcess(args=args, returncode=-(signal.SIGINT))
+        except FileNotFoundError as e:
+            # Without a shell, a missing program raises rather than producing
+            # a non-zero return code. Report it the same way a shell would.
+            if capture:
+                if text:
+                    return subprocess.CompletedProcess(cmd, 127, stdout='', stderr=str(e))
+                
+                return subprocess.CompletedProcess(cmd, 127, stdout=b'', stderr=str(e).encode('utf-8'))
+            
+            self.stderr.write(str(e), style='normal')
+            return subprocess.CompletedProcess(cmd, 127)
     
     def execute(self):
         """
@@ -191,8 +242,43 @@ class SimpleTask(BaseTask):
         else:
             raise TaskDefinitionError(f'Unrecognised task format for "{name}".')
         
+        self._final = False
+        
         super().__init__(prog, name, conf, default_stdout, default_stderr, argv)
     
+    def get_default_options(self, default_stdout, default_stderr):
+        
+        # String- and function-based tasks only accept the common arguments
+        # defined by BaseTask.create_parser(), so their defaults are known
+        return {
+            'stdout': default_stdout,
+            'stderr': default_stderr,
+            'no_color': False
+        }
+    
+    def execute(self, final=False):
+        """
+        Execute this task, as per ``BaseTask.execute()``. Use ``final=True``
+        to indicate nothing else will be run by the current process once the
+        task is complete, allowing the process to be replaced by the task's
+        command rather than waiting on it.
+        """
+        
+        self._final = final
+        super().execute()
+    
+    def _can_replace_process(self):
+        
+        # The current process can only be replaced when nothing else runs
+        # after the task, and when the command would write to the same
+        # streams anyway (redirected output streams are not inherited)
+        return (
+            self._final
+            and os.name == 'posix'
+            and self.using_system_out
+            and self.using_system_err
+        )
+    
     def handle(self, *args, **kwargs):
         
         if self._is_callable:
@@ -200,8 +286,34 @@ class SimpleTask(BaseTask):
         else:
             cmd = self.task
         
-        if cmd:
-            self.cli(cmd)
+        if not cmd:
+            return
+        
+        if isinstance(cmd, str) and self._can_replace_process():
+            # Replace the process with the same shell subprocess.run() would
+            # use, saving a fork and leaving the command's exit status as
+            # that of the process. Flush first, as buffered output is lost.
+            sys.stdout.flush()
+            sys.stderr.flush()
+            
+            # Python ignores some signals that subprocess.run() restores to
+            # their defaults in the child, so do the same before exec'ing.
+            # Otherwise, e.g. commands writing to a closed pipe see EPIPE
+            # errors rather than being terminated quietly by SIGPIPE.
+            for name in RESTORED_SIGNALS:
+                if hasattr(signal, name):
+                    signal.signal(getattr(signal, name), signal.SIG_DFL)
+            
+            os.execv('/bin/sh', ['/bin/sh', '-c', cmd])  # noqa: S606
+        
+        result = self.cli(cmd)
+        
+        # Exit with the command's exit status, as if the process had been
+        # replaced, so the status doesn't depend on whether output streams
+        # are redirected. Report signals as a shell would (128 + signal).
+        if self._final and result.returncode:
+            returncode = result.returncode
+            sys.exit(returncode if returncode > 0 else 128 - returncode)
 
 
 class Task(BaseTask):
@@ -226,6 +338,21 @@ class Task(BaseTask):
         
         return parser
     
+    def get_default_options(self, default_stdout, default_stderr):
+        
+        # Tasks that don't add their own arguments (or otherwise customise the
+        # parser) only accept the common arguments, so their defaults are known
+        cls = type(self)
+        if cls.add_arguments is not Task.add_arguments or cls.create_parser is not Task.create_parser:
+            return None
+        
+        return {
+            'stdout': default_stdout,
+            'stderr': default_stderr,
+            'no_color': False,
+            'verbosity': 1
+        }
+    
     @property
     def project_dir(self):
         
@@ -285,12 +412,15 @@ class Task(BaseTask):
         """
         
         try:
-            task = self.conf.get_tasks()[task_name]
+            tasks = self.conf.get_tasks()
         except FileNotFoundError as e:
             raise TaskDefinitionError(e)
-        except KeyError:
+        
+        if task_name not in tasks:
             raise TaskDefinitionError(f'Unknown task "{task_name}".')
         
+        task = tasks[task_name]
+        
         # Don't pass through the OutputWrapper instances themselves, just the
         # stream they wrap. The nested task instance will create its own
         # OutputWrapper around it, potentially with a different configuration
@@ -304,14 +434,23 @@ class Task(BaseTask):
         # Get the proxy instance, allow raising TaskDefinitionError if necessary
         proxy = TaskProxy('proxy.execute', task_name, task, self.conf, stdout, stderr)
         
-        # Propagate common arguments of the source task, if not provided explicitly
+        # Propagate common arguments of the source task, if not provided
+        # explicitly. Collect the flags provided in a single pass, accounting
+        # for the "--flag=value" and "-fvalue" forms.
         args = list(args)
         
-        if '--no-color' not in args and self.kwargs['no_color']:
+        provided = set()
+        for arg in args:
+            if arg.startswith('--'):
+                provided.add(arg.split('=', 1)[0])
+            elif arg.startswith('-'):
+                provided.add(arg[:2])
+        
+        if '--no-color' not in provided and self.kwargs['no_color']:
             args.append('--no-color')
         
         if not proxy.simple:
-            if '-v' not in args and '--verbosity' not in args:
+            if '-v' not in provided and '--verbosity' not in provided:
                 args.extend(('--verbosity', str(self.kwargs['verbosity'])))
         
         proxy.argv = args
@@ -337,27 +476,19 @@ class TaskProxy:
     
     def __init__(self, prog, name, task, conf, stdout=None, stderr=None, argv=None):
         
-        try:
-            valid_name = TASK_NAME_RE.match(name)
-        except TypeError:  # not a string
-            valid_name = False
-        
-        if not valid_name:
+        if not isinstance(name, str) or not TASK_NAME_RE.match(name):
             raise TaskDefinitionError(
                 f'Task name "{name}" is not valid - must be a string '
                 'containing alphanumeric characters and the underscore only.'
             )
         
         if isinstance(task, type) and issubclass(task, Task):
-            self.description = clean_description(task.help)
             self.description_fg = 'blue'
             self.simple = False
         elif callable(task):
-            self.description = clean_description(task.__doc__)
             self.description_fg = 'blue'
             self.simple = True
         elif isinstance(task, str):
-            self.description = task
             self.description_fg = 'green'
             self.simple = True
         else:
@@ -377,6 +508,20 @@ class TaskProxy:
         self.stderr = stderr
         self.argv = argv
     
+    @cached_property
+    def description(self):
+        
+        # Only generated when listing tasks, so it is not worth cleaning up
+        # docstrings/help text for tasks that are simply being executed
+        task = self.task
+        
+        if isinstance(task, str):
+            return task
+        elif not self.simple:
+            return clean_description(task.help)
+        else:
+            return clean_description(task.__doc__)
+    
     def get_description(self, styler):
         """
         Return a description of this task, suitable for display in a listing
@@ -388,7 +533,7 @@ class TaskProxy:
         
         return f'{name}: {description}\n    See "{self.prog} --help" for usage details'
     
-    def execute(self, passive=True):
+    def execute(self, passive=True, final=False):
         
         common_args = (self.prog, self.name, self.conf, self.stdout, self.stderr, self.argv)
         
@@ -405,5 +550,10 @@ class TaskProxy:
         # execute() method will deal with them if left uncaught.
         if passive:
             task.handle(*task.args, **task.kwargs)
+        elif final and self.simple:
+            # Nothing else runs after a "final" task (i.e. one invoked
+            # directly from the command line), so simple tasks can replace
+            # the current process with the command they execute
+            task.execute(final=True)
         else:
             task.execute()
@@ -1,12 +1,9 @@
 import os
+from importlib.util import find_spec
 
 from .base import Task, TaskError
 
-try:
-    import sphinx  # noqa
-    HAS_SPHINX = True
-except ImportError:
-    HAS_SPHINX = False
+HAS_SPHINX = find_spec('sphinx') is not None
 
 
 class DocsTask(Task):
@@ -1,27 +1,16 @@
 import os
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from importlib.util import find_spec
 
 from jogger.utils.files import walk
 
 from .base import Task, TaskError
 
-try:
-    import ruff  # noqa: F401
-    HAS_RUFF = True
-except ImportError:
-    HAS_RUFF = False
-
-try:
-    import isort  # noqa: F401
-    HAS_ISORT = True
-except ImportError:
-    HAS_ISORT = False
-
-try:
-    from django.core.management import call_command  # noqa: F401
-    HAS_DJANGO = True
-except ImportError:
-    HAS_DJANGO = False
+HAS_RUFF = find_spec('ruff') is not None
+HAS_ISORT = find_spec('isort') is not None
+HAS_DJANGO = find_spec('django') is not None
 
 ENDINGS = {
     'CRLF': b'\r\n',
@@ -34,6 +23,44 @@ DEFAULT_MAX_FILESIZE = 1024 * 1024  # 1MB in bytes
 DEFAULT_SYSCHECK_FAIL_LEVEL = 'WARNING'
 
 
+def get_line_endings(content):
+    """
+    Return the set of line endings (as keys of ``ENDINGS``) used in the
+    ``content`` bytestring. The CR and LF characters making up CRLF line
+    endings are not also counted as CR or LF line endings.
+    """
+    
+    found = set()
+    
+    crlf_count = content.count(ENDINGS['CRLF'])
+    if crlf_count:
+        found.add('CRLF')
+    
+    if content.count(ENDINGS['CR']) > crlf_count:
+        found.add('CR')
+    
+    if content.count(ENDINGS['LF']) > crlf_count:
+        found.add('LF')
+    
+    return found
+
+
+def _scan_file(filename, max_filesize, sample_size):
+    
+    if os.path.getsize(filename) > max_filesize:
+        return None  # skipped
+    
+    with open(filename, 'rb') as f:
+        content = f.read(sample_size or -1)
+    
+    # A partial read may end between the two characters of a CRLF ending.
+    # Don't count the trailing CR as a line ending in its own right.
+    if sample_size and len(content) == sample_size and content.endswith(b'\r'):
+        content = content[:-1]
+    
+    return get_line_endings(content)
+
+
 class LintTask(Task):
     
     help = (
@@ -112,13 +139,13 @@ class LintTask(Task):
         
         if HAS_ISORT:
             self.stdout.write('Running isort...', style='label')
-            result = self.cli('isort --check-only --diff .')
+            result = self.cli(['isort', '--check-only', '--diff', '.'])
             self.outcomes['isort'] = result.returncode == 0
             self.stdout.write('')  # newline
         
         if HAS_RUFF:
             self.stdout.write('Running ruff...', style='label')
-            result = self.cli('ruff check .')
+            result = self.cli(['ruff', 'check', '.'])
             self.outcomes['ruff'] = result.returncode == 0
             self.stdout.write('')  # newline
     
@@ -135,6 +162,22 @@ class LintTask(Task):
         
         return excludes
     
+    def _get_fable_sample_size(self):
+        
+        # Get the number of bytes to analyse from the start of each file from
+        # settings, if only a sample should be checked (0 = the entire file)
+        sample_size = self.settings.get('fable_sample_size', 0)
+        
+        try:
+            sample_size = int(sample_size)
+        except (TypeError, ValueError):
+            raise TaskError(f'Invalid value for fable_sample_size setting ({sample_size}).')
+        
+        if sample_size < 0:
+            raise TaskError(f'Invalid value for fable_sample_size setting ({sample_size}).')
+        
+        return sample_size
+    
     def handle_fable(self, explicit):
         
         self.stdout.write('Running fable...', style='label')
@@ -146,8 +189,7 @@ class LintTask(Task):
         if good_ending not in ENDINGS:
             raise TaskError(f'Invalid value for fable_good_endings setting ({good_ending}).')
         
-        # Compile inverse dictionary of bad line endings
-        bad_endings = {v: k for k, v in ENDINGS.items() if k != good_ending}
+        bad_endings = [k for k in ENDINGS if k != good_ending]
         
         # Get the maximum file size to analyse from settings
         max_filesize = self.settings.get('fable_max_filesize', DEFAULT_MAX_FILESIZE)
@@ -157,25 +199,38 @@ class LintTask(Task):
         except ValueError:
             raise TaskError(f'Invalid value for fable_max_filesize setting ({max_filesize}).')
         
-        result = True
+        sample_size = self._get_fable_sample_size()
+        
+        filenames = list(walk('./', excludes))
+        
+        # Files are scanned independently and the work is mostly waiting on
+        # reads, so overlap them using a pool of threads. map() yields results
+        # in the order of `filenames`, keeping the output stable.
+        with ThreadPoolExecutor() as executor:
+            scan = partial(_scan_file, max_filesize=max_filesize, sample_size=sample_size)
+            scanned = executor.map(scan, filenames)
+            results = list(zip(filenames, scanned))
+        
+        detections = []
         skipped = 0
-        for filename in walk('./', excludes):
-            if os.path.getsize(filename) > max_filesize:
+        for filename, endings in results:
+            if endings is None:
                 skipped += 1
                 continue
             
-            with open(filename, 'rb') as f:
-                content = f.read()
-                for ending in bad_endings:
-                    if ending in content:
-                        self.stdout.write(f'Detected {bad_endings[ending]}: {filename}')
-                        result = False
-                        break
+            for ending in bad_endings:
+                if ending in endings:
+                    detections.append(f'Detected {ending}: {filename}')
+                    break
+        
+        # Write all detections at once rather than one line at a time
+        if detections:
+            self.stdout.write('\n'.join(detections))
         
         if skipped:
             self.stdout.write(f'Skipped {skipped} large files')
         
-        self.outcomes['fable'] = result
+        self.outcomes['fable'] = not detections
         self.stdout.write('')  # newline
     
     def handle_migrations(self, explicit):
@@ -187,7 +242,7 @@ class LintTask(Task):
         if HAS_DJANGO:
             self.stdout.write('Checking for missing migrations...', style='label')
             
-            result = self.cli('python manage.py makemigrations --dry-run --check --skip-checks')
+            result = self.cli(['python', 'manage.py', 'makemigrations', '--dry-run', '--check', '--skip-checks'])
             
             self.outcomes['migrations'] = result.returncode == 0
             self.stdout.write('')  # newline
@@ -202,7 +257,7 @@ class LintTask(Task):
             self.stdout.write('Running Django system checks...', style='label')
             
             fail_level = self.settings.get('syschecks_fail_level', DEFAULT_SYSCHECK_FAIL_LEVEL)
-            result = self.cli(f'python manage.py check --fail-level {fail_level}')
+            result = self.cli(['python', 'manage.py', 'check', '--fail-level', fail_level])
             
             self.outcomes['syschecks'] = result.returncode == 0
             self.stdout.write('')  # newline
@@ -1,25 +1,12 @@
 import argparse
 import os
+from importlib.util import find_spec
 
 from .base import Task, TaskError
 
-try:
-    import django  # noqa
-    HAS_DJANGO = True
-except ImportError:
-    HAS_DJANGO = False
-
-try:
-    import coverage  # noqa
-    HAS_COVERAGE = True
-except ImportError:
-    HAS_COVERAGE = False
-
-try:
-    import tblib  # noqa
-    HAS_TBLIB = True
-except ImportError:
-    HAS_TBLIB = False
+HAS_DJANGO = find_spec('django') is not None
+HAS_COVERAGE = find_spec('coverage') is not None
+HAS_TBLIB = find_spec('tblib') is not None
 
 
 class TestTask(Task):
@@ -156,7 +143,7 @@ class TestTask(Task):
             pass
         
         # Erase the actual coverage data
-        self.cli('coverage erase')
+        self.cli(['coverage', 'erase'])
     
     def store_reporting_includes(self, test_paths, accumulate=False):
         
@@ -275,13 +262,13 @@ class TestTask(Task):
         
         self.stdout.write(self.styler.label(f'{self.section_prefix}Coverage summary'))
         
-        cmd = 'coverage report'
+        cmd = ['coverage', 'report']
         
         if includes:
-            cmd = f'{cmd} --include {includes}'
+            cmd.extend(('--include', includes))
         
         if verbosity < 2:
-            cmd = f'{cmd} --skip-covered'
+            cmd.append('--skip-covered')
         
         self.cli(cmd)
     
@@ -289,13 +276,13 @@ class TestTask(Task):
         
         self.stdout.write(self.styler.label(f'{self.section_prefix}Generating HTML report...'))
         
-        cmd = 'coverage html'
+        cmd = ['coverage', 'html']
         
         if includes:
-            cmd = f'{cmd} --include {includes}'
+            cmd.extend(('--include', includes))
         
         if verbosity < 2:
-            cmd = f'{cmd} --skip-covered'
+            cmd.append('--skip-covered')
         
         self.cli(cmd)
         
@@ -334,7 +321,7 @@ class TestTask(Task):
         
         if handle_coverage:
             self.stdout.write('')  # newline
-            self.cli('coverage combine')
+            self.cli(['coverage', 'combine'])
         
         # Generate and store an "includes" list, based on the given test paths,
         # for use in later coverage reporting. This MUST be done after previous
@@ -86,18 +86,22 @@ class UpdateTask(Task):
         
         # Get remote refs up to date before checking. Swallow output so it
         # isn't written to the output stream.
-        update_result = self.cli('git remote update', capture=True)
+        update_result = self.cli('git remote update', capture=True, text=True)
         if update_result.returncode:
-            self.stderr.write(update_result.stderr.decode('utf-8'))
+            self.stderr.write(update_result.stderr)
             raise TaskError('Update check failed, could not update remotes')
         
         branch_name = self.branch_name
-        log_result = self.cli(f'git log --oneline origin {branch_name}..{branch_name} | wc -l', capture=True)
-        if log_result.returncode:
-            self.stderr.write(log_result.stderr.decode('utf-8'))
+        count_result = self.cli(
+            ['git', 'rev-list', '--count', f'{branch_name}..origin/{branch_name}'],
+            capture=True,
+            text=True
+        )
+        if count_result.returncode:
+            self.stderr.write(count_result.stderr)
             raise TaskError('Update check failed, could not run diff')
         
-        update_count = int(log_result.stdout)
+        update_count = int(count_result.stdout)
         if not update_count:
             self.stdout.write('No remote changes')
             sys.exit(0)
@@ -147,7 +151,7 @@ class UpdateTask(Task):
         
         # Check for dependency updates by diffing the stored requirements.txt
         # file with the one just pulled in
-        diff_result = self.cli(f'diff -U 0 {temp_requirements_path} {requirements_path}', capture=True)
+        diff_result = self.cli(f'diff -U 0 {temp_requirements_path} {requirements_path}', capture=True, text=True)
         
         if not diff_result.returncode:
             self.stdout.write('No changes detected')
@@ -159,7 +163,7 @@ class UpdateTask(Task):
         if self.kwargs['no_input']:
             answer = 'y'
         else:
-            self.stdout.write(diff_result.stdout.decode('utf-8'))
+            self.stdout.write(diff_result.stdout)
             
             answer = input(
                 'The above Python library dependency changes were detected, '
@@ -193,7 +197,7 @@ class UpdateTask(Task):
         # Ignore all warnings to avoid polluting stderr
         cmd = "python -W ignore manage.py migrate --plan --check"
         
-        plan_result = self.cli(cmd, capture=True)
+        plan_result = self.cli(cmd, capture=True, text=True)
         if not plan_result.returncode:
             self.stdout.write('No changes detected')
             return True
@@ -202,13 +206,13 @@ class UpdateTask(Task):
         # proceed with a migration or not. Alternatively, if running in
         # no-input mode, proceed directly with the migrations.
         if plan_result.stderr:
-            self.stderr.write(plan_result.stderr.decode('utf-8').strip(), style='normal')
+            self.stderr.write(plan_result.stderr.strip(), style='normal')
             self.stderr.write('Migration failed')
             return False
         elif self.kwargs['no_input']:
             answer = 'y'
         else:
-            self.stdout.write(plan_result.stdout.decode('utf-8'))
+            self.stdout.write(plan_result.stdout)
             answer = input('The above migrations are unapplied, apply them now [y/n]? ')
         
         if answer.lower() == 'y':
@@ -239,10 +243,10 @@ class UpdateTask(Task):
         # Fake a call to the management command to get the prompt (including
         # the list of stale content types). Ignore all warnings to avoid
         # polluting stderr.
-        result = self.cli('yes no | python -W ignore manage.py remove_stale_contenttypes', capture=True)
+        result = self.cli('yes no | python -W ignore manage.py remove_stale_contenttypes', capture=True, text=True)
         
         if result.returncode:
-            self.stderr.write(result.stderr.decode('utf-8').strip(), style='normal')
+            self.stderr.write(result.stderr.strip(), style='normal')
             self.stderr.write('Failed to detect stale content types')
             return False
         elif not result.stdout:
@@ -251,7 +255,7 @@ class UpdateTask(Task):
         
         # Some stale content types were found. Strip off the last line of
         # output (the prompt) and manually re-prompt in order to detect skipping
-        output = result.stdout.decode('utf-8').strip().splitlines()[:-1]
+        output = result.stdout.strip().splitlines()[:-1]
         self.stdout.write('\n'.join(output))
         
         answer = input("Type 'yes' to continue, or 'no' to cancel: ")
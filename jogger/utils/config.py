@@ -1,5 +1,7 @@
 import configparser
+import copy
 import os
+from functools import lru_cache
 from importlib.util import module_from_spec, spec_from_file_location
 
 try:
@@ -13,13 +15,33 @@ from .files import find_file
 
 MAX_CONFIG_FILE_SEARCH_DEPTH = 8
 JOG_FILE_NAME = 'jog.py'
+PROJECT_ROOT_ENV_VAR = 'JOG_PROJECT_ROOT'
 CONFIG_TABLE = 'jogger'
 
 
-def get_toml_config(file_path, table):
+@lru_cache(maxsize=None)
+def _load_toml(file_path, mtime):
     
+    # `mtime` only forms part of the cache key, so the file is parsed again
+    # if it is modified
     with open(file_path, 'rb') as f:
-        config = tomllib.load(f)
+        return tomllib.load(f)
+
+
+@lru_cache(maxsize=None)
+def _load_ini(file_path, mtime):
+    
+    # `mtime` only forms part of the cache key, so the file is parsed again
+    # if it is modified
+    config = configparser.ConfigParser()
+    config.read(file_path)
+    
+    return config
+
+
+def get_toml_config(file_path, table):
+    
+    config = _load_toml(file_path, os.stat(file_path).st_mtime_ns)
     
     for t in table.split('.'):  # support nested tables
         try:
@@ -27,13 +49,14 @@ def get_toml_config(file_path, table):
         except KeyError:
             return {}
     
-    return config
+    # The parsed file is cached, so don't hand out references to its nested
+    # lists and tables, otherwise any modification would affect later lookups
+    return copy.deepcopy(config)
 
 
 def get_ini_config(file_path, section):
     
-    config = configparser.ConfigParser()
-    config.read(file_path)
+    config = _load_ini(file_path, os.stat(file_path).st_mtime_ns)
     
     try:
         config = config[section]
@@ -63,6 +86,10 @@ class JogConf:
     not found, raise ``FileNotFoundError`` - the project must contain this
     file in order to use ``jogger``.
     
+    If the ``JOG_PROJECT_ROOT`` environment variable names a directory
+    containing the task definition file, that file is used directly and the
+    search is skipped.
+    
     The location of the task definition file dictates the "project directory"
     for the purposes of ``jogger``, and any other config files must also appear
     under the same directory.
@@ -70,13 +97,25 @@ class JogConf:
     
     def __init__(self):
         
-        path = os.getcwd()
+        jog_file_path = None
+        
+        # Use the explicitly configured project directory, if any, falling
+        # back to searching for the task definition file if it isn't there
+        project_root = os.environ.get(PROJECT_ROOT_ENV_VAR)
+        if project_root:
+            jog_file_path = os.path.join(os.path.abspath(project_root), JOG_FILE_NAME)
+            if not os.path.isfile(jog_file_path):
+                jog_file_path = None
+        
+        if not jog_file_path:
+            jog_file_path = find_file(JOG_FILE_NAME, os.getcwd(), MAX_CONFIG_FILE_SEARCH_DEPTH)
         
-        jog_file_path = find_file(JOG_FILE_NAME, path, MAX_CONFIG_FILE_SEARCH_DEPTH)
         project_dir = os.path.dirname(jog_file_path)
         
         self.project_dir = project_dir
         self.jog_file_path = jog_file_path
+        self._tasks = None
+        self._task_settings = {}
         
         # Define paths to accepted config files, and the prefixes for the table
         # within each file, to which the name of the task will be added, that
@@ -102,17 +141,23 @@ class JogConf:
         its inner ``tasks`` dictionary. Raise ``TaskDefinitionError`` if no
         ``tasks`` dictionary is defined in the imported module.
         
+        The file is only imported once per ``JogConf`` instance. Subsequent
+        calls return the same dictionary.
+        
         :return: The task definition file's dictionary of tasks.
         """
         
-        spec = spec_from_file_location('jog', self.jog_file_path)
-        jog_file = module_from_spec(spec)
-        spec.loader.exec_module(jog_file)
+        if self._tasks is None:
+            spec = spec_from_file_location('jog', self.jog_file_path)
+            jog_file = module_from_spec(spec)
+            spec.loader.exec_module(jog_file)
+            
+            try:
+                self._tasks = jog_file.tasks
+            except AttributeError:
+                raise TaskDefinitionError(f'No tasks dictionary defined in {JOG_FILE_NAME}.')
         
-        try:
-            return jog_file.tasks
-        except AttributeError:
-            raise TaskDefinitionError(f'No tasks dictionary defined in {JOG_FILE_NAME}.')
+        return self._tasks
     
     def get_task_settings(self, task_name):
         """
@@ -120,9 +165,17 @@ class JogConf:
         return a dictionary of the settings corresponding to ``task_name``. If
         no such settings exist, return an empty dictionary.
         
+        Settings are only located once per task name per ``JogConf`` instance.
+        Subsequent calls return a (deep) copy of the same settings.
+        
         :return: The settings for the given task, as a dictionary.
         """
         
+        try:
+            return copy.deepcopy(self._task_settings[task_name])
+        except KeyError:
+            pass
+        
         settings = {}
         
         # Look first for project-wide config files, then for
@@ -145,4 +198,6 @@ class JogConf:
                             settings.update(config)
                             break
         
-        return settings
+        self._task_settings[task_name] = settings
+        
+        return copy.deepcopy(settings)
@@ -1,5 +1,7 @@
 import os
+import re
 from fnmatch import fnmatch as std_fnmatch
+from fnmatch import translate
 
 
 def find_file(target_file_name, from_path, max_search_depth=16):
@@ -16,27 +18,45 @@ def find_file(target_file_name, from_path, max_search_depth=16):
     """
     
     path = from_path
-    matched_file = None
     depth = 0
     
     while path and depth < max_search_depth:
         filename = os.path.join(path, target_file_name)
         
-        if os.path.exists(filename):
-            matched_file = filename
-            break
+        # Only match regular files, so a directory of the same name does not
+        # end the search early. A single stat() call either way.
+        if os.path.isfile(filename):
+            return filename
         
         new_path = os.path.dirname(path)
         if new_path == path:
-            break
+            break  # reached the filesystem root
         
         path = new_path
         depth += 1
     
-    if not matched_file:
-        raise FileNotFoundError(f'Could not find {target_file_name}.')
+    raise FileNotFoundError(f'Could not find {target_file_name}.')
+
+
+def compile_patterns(patterns):
+    """
+    Compile the ``fnmatch``-style pattern strings in ``patterns`` into a single
+    regular expression, matching any string that matches at least one of the
+    patterns. Matching against the result is considerably faster than testing
+    each pattern in turn when many strings need to be tested. If there are no
+    patterns, the result never matches.
+    
+    :param patterns: An iterable of patterns to compile.
+    :return: The compiled regular expression.
+    """
+    
+    # Normalise case in the same way as the standard library's fnmatch()
+    patterns = [translate(os.path.normcase(p)) for p in patterns]
     
-    return matched_file
+    if not patterns:
+        return re.compile('(?!)')  # an empty pattern would match everything
+    
+    return re.compile('|'.join(patterns))
 
 
 def fnmatch(filename, patterns):
@@ -46,11 +66,18 @@ def fnmatch(filename, patterns):
     to test each pattern. Return ``True`` if the filename matches or ``False``
     if it does not.
     
+    ``patterns`` can also be a regular expression previously compiled by
+    :func:`compile_patterns`, in which case it is used directly.
+    
     :param filename: The filename to test.
-    :param patterns: An iterable of patterns to test against.
+    :param patterns: An iterable of patterns, or a compiled regular expression,
+        to test against.
     :return: ``True`` if a match is found, ``False`` if not.
     """
     
+    if isinstance(patterns, re.Pattern):
+        return patterns.match(os.path.normcase(filename)) is not None
+    
     return any(std_fnmatch(filename, pattern) for pattern in patterns)
 
 
@@ -61,7 +88,8 @@ def pathmatch(path, patterns):
     path also tested against ``patterns``.
     
     :param path: The file path to test.
-    :param patterns: An iterable of patterns to test against.
+    :param patterns: An iterable of patterns, or a compiled regular expression,
+        to test against. See :func:`fnmatch`.
     :return: ``True`` if a match is found, ``False`` if not.
     """
     
@@ -76,6 +104,20 @@ def pathmatch(path, patterns):
     return fnmatch(absolute_path, patterns)
 
 
+def _compile_excludes(patterns):
+    
+    if isinstance(patterns, re.Pattern):
+        return patterns
+    
+    # Consume the patterns into a tuple first, so that an empty iterable of
+    # any kind (e.g. a generator) is treated as no patterns at all
+    patterns = tuple(patterns or ())
+    if not patterns:
+        return None
+    
+    return compile_patterns(patterns)
+
+
 def walk(from_path, exclude_patterns=None):
     """
     Yield all filenames under the ``from_path`` directory, optionally excluding
@@ -83,9 +125,14 @@ def walk(from_path, exclude_patterns=None):
     ``exclude_patterns``.
     
     :param from_path: The root directory to walk.
-    :param exclude_patterns: An iterable of patterns to test against.
+    :param exclude_patterns: An iterable of patterns, or a compiled regular
+        expression, to test against. See :func:`fnmatch`.
     """
     
+    # Compile the patterns up front, as every file and directory will be
+    # tested against them
+    exclude_patterns = _compile_excludes(exclude_patterns)
+    
     if not exclude_patterns:
         # No exclusion patterns, perform simple directory walk
         for root, dirs, files in os.walk(from_path):
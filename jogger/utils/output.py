@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import cached_property, lru_cache, partial
 from inspect import cleandoc
 from io import TextIOBase
 
@@ -39,6 +40,51 @@ def clean_description(description, collapse_paragraphs=True):
     return description
 
 
+@lru_cache(maxsize=None)
+def get_style_prefix(fg=None, bg=None, options=()):
+    """
+    Return the ANSI graphics code that applies the given combination of
+    ``fg``, ``bg``, and ``options``, or an empty string if none are given.
+    Results are cached, as only a handful of combinations are ever used.
+    """
+    
+    code_list = []
+    
+    if fg:
+        code_list.append(FOREGROUND[fg])
+    
+    if bg:
+        code_list.append(BACKGROUND[bg])
+    
+    for o in options:
+        code_list.append(OPTIONS[o])
+    
+    if not code_list:
+        return ''
+    
+    code_list = ';'.join(code_list)
+    
+    return f'\x1b[{code_list}m'
+
+
+def wrap_style(prefix, suffix, text):
+    """
+    Return ``text`` enclosed in the given ``prefix`` and ``suffix`` strings,
+    e.g. as generated by :func:`get_style_prefix`.
+    """
+    
+    return f'{prefix}{text}{suffix}'
+
+
+def unstyled(text):
+    """
+    Return ``text`` unmodified. Used in place of styling functions when
+    styling is disabled.
+    """
+    
+    return text
+
+
 class Styler:
     """
     An object containing methods for generating styled text for a palette of
@@ -64,7 +110,7 @@ class Styler:
         styler = Styler()
         success_message = styler.success('It worked!')
         error_message = styler.error('It failed!')
-        message = styler.apply('hello', fg='red', bg='blue', opts=('blink', ))
+        message = styler.apply('hello', fg='red', bg='blue', options=('blink', ))
     """
     
     PALETTE = {
@@ -85,20 +131,28 @@ class Styler:
         for role, fmt in self.PALETTE.items():
             setattr(self, role, self.preconfigure(**fmt))
     
-    def preconfigure(self, **kwargs):
+    def preconfigure(self, fg=None, bg=None, options=(), reset=True):
         """
-        Return a function with default parameters for ``apply()``.
+        Return a function with default parameters for ``apply()``. The ANSI
+        graphics codes are determined once, up front, rather than every time
+        the function is called.
         
         Examples::
             
-            bold_red = styler.preconfigure(opts=('bold',), fg='red')
+            bold_red = styler.preconfigure(options=('bold',), fg='red')
             print(bold_red('hello'))
             
             KEYWORD = styler.preconfigure(fg='yellow')
-            COMMENT = styler.preconfigure(fg='blue', opts=('bold',))
+            COMMENT = styler.preconfigure(fg='blue', options=('bold',))
         """
         
-        return lambda text: self.apply(text, **kwargs)
+        if self.no_color:
+            return unstyled
+        
+        prefix = get_style_prefix(fg, bg, tuple(options))
+        suffix = RESET if reset else ''
+        
+        return partial(wrap_style, prefix, suffix)
     
     def apply(self, text, fg=None, bg=None, options=(), reset=True):
         """
@@ -118,8 +172,8 @@ class Styler:
         
         Examples::
             
-            styler.apply('hello', fg='red', bg='blue', opts=('blink', ))
-            styler.apply('goodbye', opts=('underscore', ))
+            styler.apply('hello', fg='red', bg='blue', options=('blink', ))
+            styler.apply('goodbye', options=('underscore', ))
             print(styler.apply('first line', fg='red', reset=False))
             print('this should be red too')
             print(styler.apply('and so should this'))
@@ -140,22 +194,12 @@ class Styler:
         if reset:
             text = f'{text}{RESET}'
         
-        code_list = []
-        
-        if fg:
-            code_list.append(FOREGROUND[fg])
+        if not (fg or bg or options):
+            return text  # no styles to apply
         
-        if bg:
-            code_list.append(BACKGROUND[bg])
+        prefix = get_style_prefix(fg, bg, tuple(options))
         
-        for o in options:
-            code_list.append(OPTIONS[o])
-        
-        if code_list:
-            code_list = ';'.join(code_list)
-            text = f'\x1b[{code_list}m{text}'
-        
-        return text
+        return f'{prefix}{text}'
     
     def reset(self):
         """
@@ -181,15 +225,41 @@ class OutputWrapper(TextIOBase):
     def __init__(self, out, default_style=None, no_color=False):
         
         self._out = out
-        
-        no_color = no_color or not self.supports_color()
-        self.styler = Styler(no_color)
+        self._no_color = no_color
         self.default_style = default_style
     
     def __getattr__(self, name):
         
         return getattr(self._out, name)
     
+    @cached_property
+    def styler(self):
+        """
+        The :class:`Styler` used to style written output. Only created when
+        first needed, as plain writes never use it.
+        """
+        
+        no_color = self._no_color or not self.supports_color()
+        
+        return Styler(no_color)
+    
+    # TextIOBase provides its own versions of the following methods, so
+    # __getattr__() is never invoked for them. Explicitly forward them to the
+    # wrapped stream instead. close() is deliberately NOT forwarded, so that
+    # discarding the wrapper does not close the underlying stream.
+    
+    def flush(self):
+        
+        return self._out.flush()
+    
+    def fileno(self):
+        
+        return self._out.fileno()
+    
+    def isatty(self):
+        
+        return self._out.isatty()
+    
     def supports_color(self):
         """
         Return True if the output stream supports color, and False otherwise.